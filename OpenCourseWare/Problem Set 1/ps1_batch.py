@@ -0,0 +1,121 @@
+import argparse
+import csv
+import json
+import sys
+from collections.abc import Iterator
+from typing import TextIO
+
+import ps1b
+from ps1c import (
+    DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+    DEFAULT_SEMI_ANNUAL_RAISE,
+    HOUSE_COST,
+    PORTION_DOWN_PAYMENT,
+    TARGET_MONTHS,
+    calculate_saving_rate_exact,
+)
+
+OUTPUT_FIELDS = {
+    "months": ("number_of_months",),
+    "rate": ("saving_rate", "number_of_steps"),
+}
+
+
+def read_records(input_file: TextIO, input_format: str) -> Iterator[dict]:
+    if input_format == "jsonl":
+        for line in input_file:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        yield from csv.DictReader(input_file)
+
+
+def get_field(record: dict, name: str, default: float) -> float:
+    # Only missing or empty fields fall back to the default; a real 0 is kept.
+    value = record.get(name)
+    return default if value in (None, "") else float(value)
+
+
+def get_month_count(record: dict, name: str, default: int) -> int:
+    # The savings loop only stops when the count reaches 0, so anything but a
+    # whole number of months >= 0 is rejected rather than truncated.
+    number_of_months = float(get_field(record, name, default))
+    if number_of_months < 0 or not number_of_months.is_integer():
+        raise ValueError(f"{name} must be a whole number of months >= 0, got {record.get(name)!r}.")
+    return int(number_of_months)
+
+
+def solve_months(record: dict) -> tuple:
+    number_of_months = ps1b.count_months(
+        float(record["annual_salary"]),
+        float(record["portion_saved"]),
+        float(record["total_cost"]) * ps1b.portion_down_payment,
+        get_field(record, "semi_annual_raise", 0),
+    )
+    return (number_of_months,)
+
+
+def solve_rate(record: dict) -> tuple:
+    return calculate_saving_rate_exact(
+        get_field(record, "house_cost", HOUSE_COST) * PORTION_DOWN_PAYMENT,
+        float(record["annual_salary"]),
+        get_month_count(record, "number_of_months", TARGET_MONTHS),
+        get_field(record, "semi_annual_raise", DEFAULT_SEMI_ANNUAL_RAISE),
+        get_field(record, "annual_investment_return_rate", DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE),
+    )
+
+
+MODELS = {
+    "months": solve_months,
+    "rate": solve_rate,
+}
+
+
+def run_batch(
+    input_file: TextIO,
+    output_file: TextIO,
+    model: str,
+    input_format: str = "csv",
+    flush_every: int = 10_000,
+) -> int:
+
+    solve = MODELS[model]
+    writer = csv.writer(output_file)
+    input_fields = None
+    number_of_records = 0
+
+    for record in read_records(input_file, input_format):
+        if input_fields is None:
+            input_fields = tuple(record)
+            writer.writerow((*input_fields, *OUTPUT_FIELDS[model], "error"))
+
+        # A bad record gets empty results and its error; the run carries on.
+        try:
+            results = (*solve(record), "")
+        except (KeyError, TypeError, ValueError) as error:
+            results = (*("" for _ in OUTPUT_FIELDS[model]), f"{type(error).__name__}: {error}")
+
+        writer.writerow((*(record.get(field, "") for field in input_fields), *results))
+        number_of_records += 1
+
+        if number_of_records % flush_every == 0:
+            output_file.flush()
+
+    output_file.flush()
+    return number_of_records
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a ps1 housing model over a file of households.")
+    parser.add_argument("model", choices=MODELS, help="months-to-goal (ps1b) or best saving rate (ps1c)")
+    parser.add_argument("input", nargs="?", default="-", help="CSV or JSONL file, or - for stdin")
+    parser.add_argument("--output", default="-", help="CSV file to write, or - for stdout")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="defaults to the input file extension")
+    arguments = parser.parse_args()
+
+    input_format = arguments.format or ("jsonl" if arguments.input.endswith(".jsonl") else "csv")
+    input_file = sys.stdin if arguments.input == "-" else open(arguments.input, newline="")
+    output_file = sys.stdout if arguments.output == "-" else open(arguments.output, "w", newline="")
+
+    with input_file, output_file:
+        run_batch(input_file, output_file, arguments.model, input_format)
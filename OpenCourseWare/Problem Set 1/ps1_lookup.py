@@ -0,0 +1,88 @@
+import mmap
+from array import array
+
+from ps1c import (
+    BISECTION_TOLERANCE,
+    DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+    DEFAULT_SEMI_ANNUAL_RAISE,
+    DOWN_PAYMENT,
+    TARGET_MONTHS,
+    calculate_saving_rate_exact,
+    calculate_total_savings,
+)
+
+HEADER_LENGTH = 4
+
+
+def build_saving_rate_index(
+    path: str,
+    min_salary: float,
+    max_salary: float,
+    number_of_points: int,
+    target_amount: float = DOWN_PAYMENT,
+) -> None:
+
+    salary_step = (max_salary - min_salary) / (number_of_points - 1)
+    table = array("d", (min_salary, max_salary, number_of_points, target_amount))
+
+    for index in range(number_of_points):
+        saving_rate, _ = calculate_saving_rate_exact(target_amount, min_salary + index * salary_step)
+        table.append(saving_rate)
+
+    with open(path, "wb") as index_file:
+        table.tofile(index_file)
+
+
+class SavingRateIndex:
+    def __init__(self, path: str):
+        with open(path, "rb") as index_file:
+            self.buffer = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.table = memoryview(self.buffer).cast("d")
+
+        self.min_salary, self.max_salary, number_of_points, self.target_amount = self.table[:HEADER_LENGTH]
+        self.number_of_points = int(number_of_points)
+        self.salary_step = (self.max_salary - self.min_salary) / (self.number_of_points - 1)
+        self.saving_rates = self.table[HEADER_LENGTH:]
+
+        # Savings at a full saving rate for a salary of 1 on the default schedule.
+        self.unit_savings = calculate_total_savings(
+            1, 1, TARGET_MONTHS, DEFAULT_SEMI_ANNUAL_RAISE, DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE
+        )
+
+    def bisection_error(self, annual_salary: float) -> float:
+        return BISECTION_TOLERANCE / (annual_salary * self.unit_savings)
+
+    def query(self, annual_salary: float) -> tuple[float, float]:
+        # Returns a saving rate and a bound on its distance from the exact
+        # rate target_amount / (annual_salary * unit_savings).
+        position = (annual_salary - self.min_salary) / self.salary_step
+        index = min(int(position), self.number_of_points - 2)
+
+        if position < 0 or annual_salary > self.max_salary:
+            return self.solve(annual_salary)
+
+        lower_rate = self.saving_rates[index]
+        upper_rate = self.saving_rates[index + 1]
+        if lower_rate == -1 or upper_rate == -1:
+            return self.solve(annual_salary)
+
+        fraction = position - index
+        saving_rate = lower_rate + fraction * (upper_rate - lower_rate)
+
+        # The exact rate is monotone in salary, and every stored rate is within
+        # its bisection error of the exact rate at its grid point.
+        lower_salary = self.min_salary + index * self.salary_step
+        error_bound = abs(lower_rate - upper_rate) + self.bisection_error(lower_salary)
+
+        return saving_rate, error_bound
+
+    def solve(self, annual_salary: float) -> tuple[float, float]:
+        saving_rate, _ = calculate_saving_rate_exact(self.target_amount, annual_salary)
+        if saving_rate == -1:
+            return -1, 0
+        return saving_rate, self.bisection_error(annual_salary)
+
+    def close(self) -> None:
+        self.saving_rates.release()
+        self.table.release()
+        self.buffer.close()
@@ -0,0 +1,185 @@
+import math
+from collections.abc import Callable
+
+from ps1c import (
+    DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+    DEFAULT_SEMI_ANNUAL_RAISE,
+    DOWN_PAYMENT,
+    HOUSE_COST,
+    PORTION_DOWN_PAYMENT,
+    SAVINGS_RATE_PRECISION_SCALE,
+    TARGET_MONTHS,
+    calculate_total_savings,
+)
+
+MONEY_TOLERANCE = 0.01
+MAX_BRACKET_DOUBLINGS = 64
+MAX_MONTHS = 1200
+
+
+def calculate_iteration_bound(low: float, high: float, tolerance: float) -> int:
+    # A secant step that does not halve the bracket is always followed by a
+    # bisection, so the bracket at least halves every two iterations.
+    return 2 * max(math.ceil(math.log2((high - low) / tolerance)), 0) + 1
+
+
+def find_root(
+    function: Callable[[float], float],
+    target: float,
+    low: float,
+    high: float,
+    tolerance: float,
+    is_integer: bool = False,
+) -> tuple[float, float, int]:
+    # Returns the final bracket and the number of iterations. The ends keep
+    # their original sides of the target, so for an increasing function high
+    # is the smallest point found with function(high) >= target.
+    low_error = function(low) - target
+    high_error = function(high) - target
+    if high_error == 0:
+        return high, high, 0
+    if (low_error > 0) == (high_error > 0):
+        raise ValueError("The target is not bracketed by [low, high].")
+
+    if is_integer:
+        tolerance = max(tolerance, 1)
+
+    max_iterations = calculate_iteration_bound(low, high, tolerance)
+    number_of_iterations = 0
+    use_secant = True
+
+    while high - low > tolerance:
+        if number_of_iterations == max_iterations:
+            # Only reachable when the bracket can no longer be split, e.g. a
+            # tolerance below the floating-point spacing of its ends.
+            raise ValueError(f"The bracket did not shrink to {tolerance} in {max_iterations} iterations.")
+        number_of_iterations += 1
+        width = high - low
+
+        middle = low - low_error * width / (high_error - low_error) if use_secant else (low + high) / 2
+        if is_integer:
+            middle = math.floor(middle)
+        if not low < middle < high:
+            middle = (low + high) // 2 if is_integer else (low + high) / 2
+
+        error = function(middle) - target
+        if error == 0:
+            return middle, middle, number_of_iterations
+        if (error > 0) == (low_error > 0):
+            low, low_error = middle, error
+        else:
+            high, high_error = middle, error
+
+        use_secant = high - low <= width / 2
+
+    return low, high, number_of_iterations
+
+
+def expand_bracket(
+    function: Callable[[float], float],
+    target: float,
+    high: float,
+    limit: float = math.inf,
+) -> float | None:
+
+    for _ in range(MAX_BRACKET_DOUBLINGS):
+        if function(high) >= target:
+            return high
+        if high >= limit:
+            return None
+        high = min(high * 2, limit)
+    return None
+
+
+def solve_saving_rate(
+    annual_salary: float,
+    target_amount: float = DOWN_PAYMENT,
+    number_of_months: int = TARGET_MONTHS,
+    semi_annual_raise: float = DEFAULT_SEMI_ANNUAL_RAISE,
+    annual_investment_return_rate: float = DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+) -> float | None:
+
+    def calculate_savings(saving_rate: float) -> float:
+        return calculate_total_savings(
+            saving_rate, annual_salary, number_of_months, semi_annual_raise, annual_investment_return_rate
+        )
+
+    if calculate_savings(1) < target_amount:
+        return None
+
+    _, saving_rate, _ = find_root(calculate_savings, target_amount, 0, 1, 1 / SAVINGS_RATE_PRECISION_SCALE)
+    return saving_rate
+
+
+def solve_number_of_months(
+    saving_rate: float,
+    annual_salary: float,
+    target_amount: float = DOWN_PAYMENT,
+    semi_annual_raise: float = DEFAULT_SEMI_ANNUAL_RAISE,
+    annual_investment_return_rate: float = DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+) -> int | None:
+
+    def calculate_savings(number_of_months: float) -> float:
+        return calculate_total_savings(
+            saving_rate, annual_salary, int(number_of_months), semi_annual_raise, annual_investment_return_rate
+        )
+
+    if target_amount <= 0:
+        return 0
+    # Without a contribution the savings never grow, and with one they can
+    # still level off under a negative return, so give up past MAX_MONTHS.
+    if saving_rate * annual_salary <= 0:
+        return None
+
+    high = expand_bracket(calculate_savings, target_amount, TARGET_MONTHS, MAX_MONTHS)
+    if high is None:
+        return None
+
+    _, number_of_months, _ = find_root(calculate_savings, target_amount, 0, high, 1, is_integer=True)
+    return int(number_of_months)
+
+
+def solve_max_house_cost(
+    saving_rate: float,
+    annual_salary: float,
+    number_of_months: int = TARGET_MONTHS,
+    semi_annual_raise: float = DEFAULT_SEMI_ANNUAL_RAISE,
+    annual_investment_return_rate: float = DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+) -> float:
+
+    total_savings = calculate_total_savings(
+        saving_rate, annual_salary, number_of_months, semi_annual_raise, annual_investment_return_rate
+    )
+
+    def calculate_down_payment(house_cost: float) -> float:
+        return house_cost * PORTION_DOWN_PAYMENT
+
+    high = expand_bracket(calculate_down_payment, total_savings, HOUSE_COST)
+    house_cost, _, _ = find_root(calculate_down_payment, total_savings, 0, high, MONEY_TOLERANCE)
+    return house_cost
+
+
+def solve_min_annual_salary(
+    saving_rate: float,
+    target_amount: float = DOWN_PAYMENT,
+    number_of_months: int = TARGET_MONTHS,
+    semi_annual_raise: float = DEFAULT_SEMI_ANNUAL_RAISE,
+    annual_investment_return_rate: float = DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+) -> float | None:
+
+    def calculate_savings(annual_salary: float) -> float:
+        return calculate_total_savings(
+            saving_rate, annual_salary, number_of_months, semi_annual_raise, annual_investment_return_rate
+        )
+
+    if target_amount <= 0:
+        return 0
+    if saving_rate <= 0:
+        return None
+
+    high = expand_bracket(calculate_savings, target_amount, 1)
+    if high is None:
+        return None
+
+    _, annual_salary, _ = find_root(calculate_savings, target_amount, 0, high, MONEY_TOLERANCE)
+    return annual_salary
@@ -0,0 +1,241 @@
+import argparse
+import csv
+import functools
+import itertools
+import math
+import os
+import time
+from collections import deque
+from collections.abc import Iterator, Sequence
+from multiprocessing import Pool
+
+from ps1c import (
+    DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+    DEFAULT_SEMI_ANNUAL_RAISE,
+    HOUSE_COST,
+    PORTION_DOWN_PAYMENT,
+    TARGET_MONTHS,
+    calculate_saving_rate_exact,
+)
+from result_cache import DEFAULT_MAX_BYTES, ResultCache
+
+CSV_HEADER = (
+    "annual_salary",
+    "semi_annual_raise",
+    "annual_investment_return_rate",
+    "house_cost",
+    "saving_rate",
+    "number_of_steps",
+)
+DEFAULT_CHUNK_SIZE = 10_000
+TASKS_IN_FLIGHT_PER_PROCESS = 2
+READ_BLOCK_SIZE = 1 << 20
+AXIS_EPSILON = 1e-9
+MODEL_NAME = "ps1c.calculate_saving_rate"
+MODEL_VERSION = "1"
+
+SweepChunk = tuple[Sequence[float], float, float, float]
+
+
+def iterate_sweep_chunks(
+    annual_salaries: Sequence[float],
+    semi_annual_raises: Sequence[float],
+    annual_investment_return_rates: Sequence[float],
+    house_costs: Sequence[float],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[SweepChunk]:
+
+    for semi_annual_raise, annual_investment_return_rate, house_cost in itertools.product(
+        semi_annual_raises, annual_investment_return_rates, house_costs
+    ):
+        for start in range(0, len(annual_salaries), chunk_size):
+            yield (
+                annual_salaries[start : start + chunk_size],
+                semi_annual_raise,
+                annual_investment_return_rate,
+                house_cost,
+            )
+
+
+def calculate_chunk_results(chunk: SweepChunk) -> list[float]:
+    annual_salaries, semi_annual_raise, annual_investment_return_rate, house_cost = chunk
+    target_amount = house_cost * PORTION_DOWN_PAYMENT
+
+    results = []
+    for annual_salary in annual_salaries:
+        results.extend(
+            calculate_saving_rate_exact(
+                target_amount,
+                annual_salary,
+                TARGET_MONTHS,
+                semi_annual_raise,
+                annual_investment_return_rate,
+            )
+        )
+
+    return results
+
+
+def solve_sweep_chunk(
+    chunk: SweepChunk, cache: ResultCache | None = None
+) -> tuple[int, float, list[tuple], bool | None]:
+
+    started = time.perf_counter()
+    annual_salaries, *schedule = chunk
+
+    if cache is None:
+        results = calculate_chunk_results(chunk)
+        is_hit = None
+    else:
+        hits = cache.hits
+        results = cache.get_or_compute(
+            MODEL_NAME,
+            MODEL_VERSION,
+            [list(annual_salaries), TARGET_MONTHS, *schedule],
+            functools.partial(calculate_chunk_results, chunk),
+        )
+        is_hit = cache.hits > hits
+
+    rows = [
+        (annual_salary, *schedule, results[2 * index], int(results[2 * index + 1]))
+        for index, annual_salary in enumerate(annual_salaries)
+    ]
+
+    return os.getpid(), time.perf_counter() - started, rows, is_hit
+
+
+def count_completed_rows(output_path: str) -> int:
+    if not os.path.exists(output_path):
+        return 0
+
+    with open(output_path, "rb+") as output_file:
+        # Drop a trailing partial line left behind by an interrupted sweep,
+        # searching backwards from the end one block at a time.
+        end = output_file.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(end - READ_BLOCK_SIZE, 0)
+            output_file.seek(start)
+            last_newline = output_file.read(end - start).rfind(b"\n")
+            if last_newline != -1:
+                end = start + last_newline + 1
+                break
+            end = start
+        output_file.truncate(end)
+
+        output_file.seek(0)
+        number_of_lines = 0
+        while block := output_file.read(READ_BLOCK_SIZE):
+            number_of_lines += block.count(b"\n")
+
+    return max(number_of_lines - 1, 0)
+
+
+def skip_completed_rows(chunks: Iterator[SweepChunk], completed_rows: int) -> Iterator[SweepChunk]:
+    for annual_salaries, *schedule in chunks:
+        if completed_rows >= len(annual_salaries):
+            completed_rows -= len(annual_salaries)
+            continue
+        yield (annual_salaries[completed_rows:], *schedule)
+        completed_rows = 0
+
+
+def run_sweep(
+    output_path: str,
+    annual_salaries: Sequence[float],
+    semi_annual_raises: Sequence[float] = (DEFAULT_SEMI_ANNUAL_RAISE,),
+    annual_investment_return_rates: Sequence[float] = (DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,),
+    house_costs: Sequence[float] = (HOUSE_COST,),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    processes: int | None = None,
+    cache: ResultCache | None = None,
+) -> dict[int, float]:
+
+    completed_rows = count_completed_rows(output_path)
+    chunks = skip_completed_rows(
+        iterate_sweep_chunks(
+            annual_salaries,
+            semi_annual_raises,
+            annual_investment_return_rates,
+            house_costs,
+            chunk_size,
+        ),
+        completed_rows,
+    )
+
+    rows_by_worker = {}
+    seconds_by_worker = {}
+
+    with open(output_path, "a", newline="") as output_file, Pool(processes) as pool:
+        writer = csv.writer(output_file)
+        if completed_rows == 0 and output_file.tell() == 0:
+            writer.writerow(CSV_HEADER)
+
+        # Only a bounded window of chunks is submitted at a time, so the grid is
+        # never materialised. Results are written in submission order, so the
+        # file is always a prefix of the grid.
+        tasks_in_flight = TASKS_IN_FLIGHT_PER_PROCESS * (processes or os.cpu_count() or 1)
+        pending = deque()
+
+        def iterate_results():
+            for chunk in chunks:
+                pending.append(pool.apply_async(solve_sweep_chunk, (chunk, cache)))
+                if len(pending) >= tasks_in_flight:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+
+        for worker, elapsed, rows, is_hit in iterate_results():
+            if is_hit is not None:
+                cache.hits += is_hit
+                cache.misses += not is_hit
+            writer.writerows(rows)
+            output_file.flush()
+            rows_by_worker[worker] = rows_by_worker.get(worker, 0) + len(rows)
+            seconds_by_worker[worker] = seconds_by_worker.get(worker, 0) + elapsed
+
+    return {
+        worker: rows_by_worker[worker] / seconds_by_worker[worker]
+        for worker in rows_by_worker
+        if seconds_by_worker[worker] > 0
+    }
+
+
+def parse_axis(specification: str) -> list[float]:
+    if ":" in specification:
+        start, stop, step = (float(part) for part in specification.split(":"))
+        number_of_steps = math.floor((stop - start) / step + AXIS_EPSILON)
+        return [start + index * step for index in range(number_of_steps + 1)]
+    return [float(value) for value in specification.split(",")]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep the ps1c housing model over a parameter grid.")
+    parser.add_argument("output", help="CSV file to write; an existing file is resumed")
+    parser.add_argument("--salaries", required=True, help="start:stop:step or comma separated values")
+    parser.add_argument("--raises", default=str(DEFAULT_SEMI_ANNUAL_RAISE))
+    parser.add_argument("--returns", default=str(DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE))
+    parser.add_argument("--house-costs", default=str(HOUSE_COST))
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--cache-dir", help="directory of cached result blocks to reuse")
+    parser.add_argument("--cache-max-bytes", type=int, default=DEFAULT_MAX_BYTES)
+    arguments = parser.parse_args()
+
+    cache = ResultCache(arguments.cache_dir, arguments.cache_max_bytes) if arguments.cache_dir else None
+
+    rows_per_second = run_sweep(
+        arguments.output,
+        parse_axis(arguments.salaries),
+        parse_axis(arguments.raises),
+        parse_axis(arguments.returns),
+        parse_axis(arguments.house_costs),
+        arguments.chunk_size,
+        arguments.processes,
+        cache,
+    )
+
+    for worker, rate in sorted(rows_per_second.items()):
+        print(f"Worker {worker}: {rate:,.0f} rows/s")
+
+    if cache is not None:
+        print(f"Cache: {cache.hits} hits, {cache.misses} misses ({cache.hit_rate:.1%} hit rate)")
@@ -1,19 +1,59 @@
+import math
+
 r = 0.04
 portion_down_payment = 0.25
 
-annual_salary = float(input("Enter your annual salary: "))
-monthly_salary = annual_salary / 12
 
-portion_saved = float(input("Enter the percent of your salary to save, as a decimal: "))
+def calculate_savings_after_months(number_of_months: int, monthly_contribution: float) -> float:
+    monthly_growth = 1 + r / 12
+    return monthly_contribution * (monthly_growth ** number_of_months - 1) / (monthly_growth - 1)
+
+
+def count_months_by_stepping(annual_salary: float, portion_saved: float, down_payment: float) -> int:
+    monthly_salary = annual_salary / 12
+    current_savings = 0
+    number_of_months = 0
+    while down_payment > current_savings:
+        current_savings += current_savings * r / 12
+        current_savings += portion_saved * monthly_salary
+        number_of_months += 1
+
+    return number_of_months
+
+
+def count_months(annual_salary: float, portion_saved: float, down_payment: float) -> int:
+    if down_payment <= 0:
+        return 0
+
+    monthly_contribution = portion_saved * annual_salary / 12
+    if monthly_contribution <= 0:
+        raise ValueError("The down payment can never be reached without saving.")
+
+    # Savings after n months are the geometric series c * ((1 + r/12)^n - 1) / (r/12).
+    number_of_months = math.ceil(
+        math.log1p(down_payment * (r / 12) / monthly_contribution) / math.log1p(r / 12)
+    )
+
+    # The logarithm can land one month off when the goal is hit almost exactly.
+    while (
+        number_of_months > 1
+        and calculate_savings_after_months(number_of_months - 1, monthly_contribution) >= down_payment
+    ):
+        number_of_months -= 1
+    while calculate_savings_after_months(number_of_months, monthly_contribution) < down_payment:
+        number_of_months += 1
+
+    return number_of_months
+
+
+if __name__ == "__main__":
+    annual_salary = float(input("Enter your annual salary: "))
+
+    portion_saved = float(input("Enter the percent of your salary to save, as a decimal: "))
 
-total_cost = float(input("Enter the cost of your dream home: "))
-down_payment = total_cost * portion_down_payment
+    total_cost = float(input("Enter the cost of your dream home: "))
+    down_payment = total_cost * portion_down_payment
 
-current_savings = 0
-number_of_months = 0
-while down_payment > current_savings:
-    current_savings += current_savings * r / 12
-    current_savings += portion_saved * monthly_salary
-    number_of_months += 1
+    number_of_months = count_months(annual_salary, portion_saved, down_payment)
 
-print("Number of months:", number_of_months)
+    print("Number of months:", number_of_months)
@@ -1,29 +1,79 @@
 MONTHS_IN_YEAR = 12
+MONTHS_IN_RAISE_PERIOD = 6
 
 r = 0.04
 portion_down_payment = 0.25
 
-annual_salary = float(input("Enter your annual salary: "))
-monthly_salary = annual_salary / MONTHS_IN_YEAR
 
-portion_saved = float(input("Enter the percent of your salary to save, as a decimal: "))
+def count_months_by_stepping(
+    annual_salary: float,
+    portion_saved: float,
+    down_payment: float,
+    semi_annual_raise: float,
+) -> int:
+    monthly_salary = annual_salary / MONTHS_IN_YEAR
+    current_savings = 0
+    number_of_months = 0
 
-total_cost = float(input("Enter the cost of your dream home: "))
-down_payment = total_cost * portion_down_payment
+    while down_payment > current_savings:
+        current_savings += current_savings * r / MONTHS_IN_YEAR
+        current_savings += portion_saved * monthly_salary
+        number_of_months += 1
 
-semi_annual_raise = float(input("Enter the semi annual raise, as a decimal: "))
+        if number_of_months % MONTHS_IN_RAISE_PERIOD == 0:
+            annual_salary += semi_annual_raise * annual_salary
+            monthly_salary = annual_salary / MONTHS_IN_YEAR
 
-current_savings = 0
-number_of_months = 0
+    return number_of_months
 
-while down_payment > current_savings:
-    current_savings += current_savings * r / MONTHS_IN_YEAR
-    current_savings += portion_saved * monthly_salary
-    number_of_months += 1
 
-    if number_of_months % 6 == 0:
-        annual_salary += semi_annual_raise * annual_salary
-        monthly_salary = annual_salary / MONTHS_IN_YEAR
+def count_months(
+    annual_salary: float,
+    portion_saved: float,
+    down_payment: float,
+    semi_annual_raise: float,
+) -> int:
+    if down_payment <= 0:
+        return 0
 
+    monthly_contribution = portion_saved * annual_salary / MONTHS_IN_YEAR
+    if monthly_contribution <= 0:
+        raise ValueError("The down payment can never be reached without saving.")
 
-print("Number of months:", number_of_months)
+    monthly_growth = 1 + r / MONTHS_IN_YEAR
+    period_growth = monthly_growth ** MONTHS_IN_RAISE_PERIOD
+    contributions_growth = (period_growth - 1) / (monthly_growth - 1)
+
+    current_savings = 0
+    number_of_months = 0
+
+    # Salary is constant between raises, so a whole period is one geometric series.
+    while True:
+        period_end_savings = current_savings * period_growth + monthly_contribution * contributions_growth
+        if period_end_savings >= down_payment:
+            break
+        current_savings = period_end_savings
+        number_of_months += MONTHS_IN_RAISE_PERIOD
+        monthly_contribution += semi_annual_raise * monthly_contribution
+
+    while down_payment > current_savings:
+        current_savings += current_savings * r / MONTHS_IN_YEAR
+        current_savings += monthly_contribution
+        number_of_months += 1
+
+    return number_of_months
+
+
+if __name__ == "__main__":
+    annual_salary = float(input("Enter your annual salary: "))
+
+    portion_saved = float(input("Enter the percent of your salary to save, as a decimal: "))
+
+    total_cost = float(input("Enter the cost of your dream home: "))
+    down_payment = total_cost * portion_down_payment
+
+    semi_annual_raise = float(input("Enter the semi annual raise, as a decimal: "))
+
+    number_of_months = count_months(annual_salary, portion_saved, down_payment, semi_annual_raise)
+
+    print("Number of months:", number_of_months)
@@ -1,4 +1,10 @@
+import math
+import mmap
+import random
+from collections.abc import Callable, Iterator, Sequence
+
 MONTHS_PER_YEAR = 12
+DAYS_PER_YEAR = 365
 MONTHS_PER_SEMI_ANNUAL_PERIOD = 6
 TARGET_MONTHS = 36
 HOUSE_COST = 1_000_000
@@ -8,6 +14,27 @@ BISECTION_TOLERANCE = 100
 SAVINGS_RATE_PRECISION_SCALE = 10_000
 DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE = 0.04
 DEFAULT_SEMI_ANNUAL_RAISE = 0.07
+DEFAULT_ANNUAL_RETURN_VOLATILITY = 0.15
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+DEFAULT_SEARCH_ARITY = 8
+TRAJECTORY_COLUMNS = ("annual_salary", "savings")
+FLOAT_SIZE = 8
+
+
+def sample_normal_monthly_return(rng: random.Random, annual_mean: float, annual_volatility: float) -> float:
+    return rng.gauss(annual_mean / MONTHS_PER_YEAR, annual_volatility / math.sqrt(MONTHS_PER_YEAR))
+
+
+def sample_lognormal_monthly_return(rng: random.Random, annual_mean: float, annual_volatility: float) -> float:
+    sigma = annual_volatility / math.sqrt(MONTHS_PER_YEAR)
+    mu = math.log1p(annual_mean / MONTHS_PER_YEAR) - sigma**2 / 2
+    return rng.lognormvariate(mu, sigma) - 1
+
+
+RETURN_DISTRIBUTIONS: dict[str, Callable[[random.Random, float, float], float]] = {
+    "normal": sample_normal_monthly_return,
+    "lognormal": sample_lognormal_monthly_return,
+}
 
 
 def calculate_total_savings(
@@ -33,6 +60,199 @@ def calculate_total_savings(
     return current_savings
 
 
+def calculate_total_savings_daily(
+    saving_rate: float,
+    annual_salary: float,
+    number_of_months: int,
+    semi_annual_raise: float,
+    annual_investment_return_rate: float,
+) -> float:
+
+    # Interest compounds every day and contributions arrive at month end, so
+    # a month of daily compounding is a single growth factor.
+    daily_growth = 1 + annual_investment_return_rate / DAYS_PER_YEAR
+    monthly_growth = daily_growth ** (DAYS_PER_YEAR / MONTHS_PER_YEAR)
+    monthly_salary = annual_salary / MONTHS_PER_YEAR
+    current_savings = 0
+
+    while number_of_months:
+        current_savings *= monthly_growth
+        current_savings += saving_rate * monthly_salary
+        number_of_months -= 1
+
+        if number_of_months % MONTHS_PER_SEMI_ANNUAL_PERIOD == 0:
+            annual_salary += semi_annual_raise * annual_salary
+            monthly_salary = annual_salary / MONTHS_PER_YEAR
+
+    return current_savings
+
+
+def iterate_savings_trajectory(
+    saving_rate: float,
+    annual_salary: float,
+    number_of_months: int,
+    semi_annual_raise: float,
+    annual_investment_return_rate: float,
+) -> Iterator[tuple[int, float, float]]:
+
+    current_savings = 0
+    month = 0
+
+    while number_of_months:
+        current_savings += current_savings * annual_investment_return_rate / MONTHS_PER_YEAR
+        current_savings += saving_rate * annual_salary / MONTHS_PER_YEAR
+        number_of_months -= 1
+        month += 1
+
+        yield month, annual_salary, current_savings
+
+        if number_of_months % MONTHS_PER_SEMI_ANNUAL_PERIOD == 0:
+            annual_salary += semi_annual_raise * annual_salary
+
+
+def write_savings_trajectories(
+    path: str,
+    households: Sequence[tuple[float, float, float, float]],
+    number_of_months: int,
+) -> None:
+
+    # Layout: one contiguous column per TRAJECTORY_COLUMNS entry, each holding
+    # len(households) rows of number_of_months values.
+    column_length = len(households) * number_of_months
+
+    with open(path, "wb+") as trajectory_file:
+        if column_length == 0:
+            return
+        trajectory_file.truncate(len(TRAJECTORY_COLUMNS) * column_length * FLOAT_SIZE)
+        with mmap.mmap(trajectory_file.fileno(), 0) as buffer:
+            columns = memoryview(buffer).cast("d")
+            salaries = columns[:column_length]
+            savings = columns[column_length:]
+
+            # The views must be released before the mmap closes, or a bad
+            # household's error is replaced by a BufferError.
+            try:
+                for household_index, (saving_rate, annual_salary, *schedule) in enumerate(households):
+                    offset = household_index * number_of_months - 1
+                    for month, salary, current_savings in iterate_savings_trajectory(
+                        saving_rate, annual_salary, number_of_months, *schedule
+                    ):
+                        salaries[offset + month] = salary
+                        savings[offset + month] = current_savings
+            finally:
+                salaries.release()
+                savings.release()
+                columns.release()
+
+
+def calculate_total_savings_batch(
+    saving_rates: Sequence[float],
+    annual_salaries: Sequence[float],
+    numbers_of_months: Sequence[int],
+    semi_annual_raises: Sequence[float],
+    annual_investment_return_rates: Sequence[float],
+    calculate_savings: Callable[[float, float, int, float, float], float] = calculate_total_savings,
+) -> list[float]:
+
+    # Total savings scale linearly with saving_rate * annual_salary, so each
+    # distinct (months, raise, return) schedule only has to be simulated once.
+    unit_savings_by_schedule = {}
+    total_savings = []
+
+    for saving_rate, annual_salary, *schedule in zip(
+        saving_rates,
+        annual_salaries,
+        numbers_of_months,
+        semi_annual_raises,
+        annual_investment_return_rates,
+        strict=True,
+    ):
+        schedule = tuple(schedule)
+        unit_savings = unit_savings_by_schedule.get(schedule)
+        if unit_savings is None:
+            unit_savings = calculate_savings(1, 1, *schedule)
+            unit_savings_by_schedule[schedule] = unit_savings
+        total_savings.append(saving_rate * annual_salary * unit_savings)
+
+    return total_savings
+
+
+def calculate_percentile(sorted_values: Sequence[float], percentile: float) -> float:
+    # Linear interpolation between the closest ranks.
+    position = percentile / 100 * (len(sorted_values) - 1)
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (position - lower) * (sorted_values[upper] - sorted_values[lower])
+
+
+def calculate_monthly_contributions(
+    saving_rate: float,
+    annual_salary: float,
+    number_of_months: int,
+    semi_annual_raise: float,
+) -> list[float]:
+
+    monthly_contributions = []
+
+    while number_of_months:
+        monthly_contributions.append(saving_rate * annual_salary / MONTHS_PER_YEAR)
+        number_of_months -= 1
+
+        if number_of_months % MONTHS_PER_SEMI_ANNUAL_PERIOD == 0:
+            annual_salary += semi_annual_raise * annual_salary
+
+    return monthly_contributions
+
+
+def simulate_total_savings_paths(
+    saving_rate: float,
+    annual_salary: float,
+    number_of_paths: int,
+    number_of_months: int = TARGET_MONTHS,
+    semi_annual_raise: float = DEFAULT_SEMI_ANNUAL_RAISE,
+    annual_investment_return_rate: float = DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+    annual_return_volatility: float = DEFAULT_ANNUAL_RETURN_VOLATILITY,
+    distribution: str = "normal",
+    target_amount: float = DOWN_PAYMENT,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    seed: int | None = None,
+) -> tuple[dict[float, float], float]:
+
+    if number_of_paths < 1:
+        raise ValueError("At least one path is needed.")
+    for percentile in percentiles:
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentiles must be between 0 and 100, got {percentile}.")
+
+    # Contributions do not depend on returns, so only the growth is sampled per path.
+    monthly_contributions = calculate_monthly_contributions(
+        saving_rate, annual_salary, number_of_months, semi_annual_raise
+    )
+    sample_monthly_return = RETURN_DISTRIBUTIONS[distribution]
+    rng = random.Random(seed)
+
+    final_savings = []
+    number_of_paths_reaching_target = 0
+
+    for _ in range(number_of_paths):
+        current_savings = 0
+        reached_target = False
+
+        for monthly_contribution in monthly_contributions:
+            monthly_return = sample_monthly_return(rng, annual_investment_return_rate, annual_return_volatility)
+            current_savings += current_savings * monthly_return
+            current_savings += monthly_contribution
+            reached_target = reached_target or current_savings >= target_amount
+
+        final_savings.append(current_savings)
+        number_of_paths_reaching_target += reached_target
+
+    final_savings.sort()
+    percentile_bands = {percentile: calculate_percentile(final_savings, percentile) for percentile in percentiles}
+
+    return percentile_bands, number_of_paths_reaching_target / number_of_paths
+
+
 def calculate_saving_rate(
     target_amount: float,
     annual_salary: float,
@@ -68,12 +288,177 @@ def calculate_saving_rate(
     return -1, number_of_steps
 
 
-annual_salary = float(input("Enter the starting salary: "))
+def _bisect_scaled_saving_rate(target_amount: float, full_rate_savings: float) -> tuple[float, int]:
+
+    # Replays the bisection of calculate_saving_rate, using the fact that
+    # total savings are saving_rate * full_rate_savings.
+    number_of_steps = 0
+    left = 1
+    right = SAVINGS_RATE_PRECISION_SCALE
+
+    while left <= right:
+        number_of_steps += 1
+        mid = (left + right) // 2
+        saving_rate = mid / SAVINGS_RATE_PRECISION_SCALE
+        total_savings = saving_rate * full_rate_savings
+
+        if abs(total_savings - target_amount) <= BISECTION_TOLERANCE:
+            return saving_rate, number_of_steps
+        elif total_savings < target_amount:
+            left = mid + 1
+        else:
+            right = mid - 1
+
+    return -1, number_of_steps
+
+
+def calculate_saving_rate_exact(
+    target_amount: float,
+    annual_salary: float,
+    number_of_months: int = TARGET_MONTHS,
+    semi_annual_raise: float = DEFAULT_SEMI_ANNUAL_RAISE,
+    annual_investment_return_rate: float = DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+) -> tuple[float, int]:
+
+    full_rate_savings = calculate_total_savings(
+        1,
+        annual_salary,
+        number_of_months,
+        semi_annual_raise,
+        annual_investment_return_rate,
+    )
+
+    return _bisect_scaled_saving_rate(target_amount, full_rate_savings)
+
+
+def calculate_saving_rates_batch(
+    target_amount: float,
+    annual_salaries: Sequence[float],
+    number_of_months: int = TARGET_MONTHS,
+    semi_annual_raise: float = DEFAULT_SEMI_ANNUAL_RAISE,
+    annual_investment_return_rate: float = DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+) -> tuple[list[float], list[int], list[bool]]:
+
+    unit_savings = calculate_total_savings(
+        1, 1, number_of_months, semi_annual_raise, annual_investment_return_rate
+    )
+
+    saving_rates = []
+    numbers_of_steps = []
+    is_solved = []
+
+    for annual_salary in annual_salaries:
+        saving_rate, number_of_steps = _bisect_scaled_saving_rate(
+            target_amount, annual_salary * unit_savings
+        )
+        saving_rates.append(saving_rate)
+        numbers_of_steps.append(number_of_steps)
+        is_solved.append(saving_rate != -1)
+
+    return saving_rates, numbers_of_steps, is_solved
+
+
+def _kary_search_saving_rate(
+    target_amount: float,
+    calculate_candidate_savings: Callable[[list[float]], list[float]],
+    arity: int,
+) -> tuple[float, int]:
+
+    number_of_rounds = 0
+    left = 1
+    right = SAVINGS_RATE_PRECISION_SCALE
+
+    while left <= right:
+        number_of_rounds += 1
+        span = right - left + 1
+        candidates = sorted({left + span * (i + 1) // (arity + 1) for i in range(arity)})
+        saving_rates = [candidate / SAVINGS_RATE_PRECISION_SCALE for candidate in candidates]
+        total_savings = calculate_candidate_savings(saving_rates)
+
+        next_left, next_right = left, right
+        for candidate, saving_rate, candidate_savings in zip(candidates, saving_rates, total_savings):
+            if abs(candidate_savings - target_amount) <= BISECTION_TOLERANCE:
+                return saving_rate, number_of_rounds
+            elif candidate_savings < target_amount:
+                next_left = candidate + 1
+            else:
+                next_right = candidate - 1
+                break
+        left, right = next_left, next_right
+
+    return -1, number_of_rounds
+
+
+def calculate_saving_rate_kary(
+    target_amount: float,
+    annual_salary: float,
+    number_of_months: int = TARGET_MONTHS,
+    semi_annual_raise: float = DEFAULT_SEMI_ANNUAL_RAISE,
+    annual_investment_return_rate: float = DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+    *,
+    arity: int = DEFAULT_SEARCH_ARITY,
+) -> tuple[float, int]:
+
+    if arity < 1:
+        raise ValueError("The search arity must be at least 1.")
+
+    def calculate_candidate_savings(saving_rates: list[float]) -> list[float]:
+        number_of_candidates = len(saving_rates)
+        return calculate_total_savings_batch(
+            saving_rates,
+            [annual_salary] * number_of_candidates,
+            [number_of_months] * number_of_candidates,
+            [semi_annual_raise] * number_of_candidates,
+            [annual_investment_return_rate] * number_of_candidates,
+        )
+
+    return _kary_search_saving_rate(target_amount, calculate_candidate_savings, arity)
+
+
+def calculate_saving_rates_kary_batch(
+    target_amount: float,
+    annual_salaries: Sequence[float],
+    number_of_months: int = TARGET_MONTHS,
+    semi_annual_raise: float = DEFAULT_SEMI_ANNUAL_RAISE,
+    annual_investment_return_rate: float = DEFAULT_ANNUAL_INVESTMENT_RETURN_RATE,
+    *,
+    arity: int = DEFAULT_SEARCH_ARITY,
+) -> tuple[list[float], list[int], list[int]]:
+
+    if arity < 1:
+        raise ValueError("The search arity must be at least 1.")
+
+    unit_savings = calculate_total_savings(
+        1, 1, number_of_months, semi_annual_raise, annual_investment_return_rate
+    )
+
+    saving_rates = []
+    numbers_of_rounds = []
+    rounds_saved = []
+
+    for annual_salary in annual_salaries:
+        full_rate_savings = annual_salary * unit_savings
+        saving_rate, number_of_rounds = _kary_search_saving_rate(
+            target_amount,
+            lambda candidate_rates: [rate * full_rate_savings for rate in candidate_rates],
+            arity,
+        )
+        _, number_of_steps = _bisect_scaled_saving_rate(target_amount, full_rate_savings)
+
+        saving_rates.append(saving_rate)
+        numbers_of_rounds.append(number_of_rounds)
+        rounds_saved.append(number_of_steps - number_of_rounds)
+
+    return saving_rates, numbers_of_rounds, rounds_saved
+
+
+if __name__ == "__main__":
+    annual_salary = float(input("Enter the starting salary: "))
 
-savings_rate, number_of_steps = calculate_saving_rate(DOWN_PAYMENT, annual_salary)
+    savings_rate, number_of_steps = calculate_saving_rate_exact(DOWN_PAYMENT, annual_salary)
 
-if savings_rate == -1:
-    print("It is not possible to pay the down payment in three years.")
-else:
-    print("Best savings rate:", savings_rate)
-    print("Steps in bisection search:", number_of_steps)
+    if savings_rate == -1:
+        print("It is not possible to pay the down payment in three years.")
+    else:
+        print("Best savings rate:", savings_rate)
+        print("Steps in bisection search:", number_of_steps)
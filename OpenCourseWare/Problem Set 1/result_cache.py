@@ -0,0 +1,94 @@
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+from array import array
+from collections.abc import Callable, Sequence
+
+DEFAULT_MAX_BYTES = 1 << 30
+BLOCK_SUFFIX = ".f64"
+
+
+class ResultCache:
+    # Content-addressed blocks of float64 results on disk. A block's name is
+    # the hash of the model, its version and the parameters that produced it,
+    # so changing any of them misses instead of returning stale results.
+    # Blocks are memory-mapped on load and the least recently used ones are
+    # evicted once the directory grows past max_bytes.
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(model: str, version: str, parameters) -> str:
+        content = json.dumps([model, version, parameters], sort_keys=True)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + BLOCK_SUFFIX)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+    def load(self, key: str) -> Sequence[float] | None:
+        path = self.get_path(key)
+        try:
+            with open(path, "rb") as block_file:
+                if os.fstat(block_file.fileno()).st_size == 0:
+                    values = memoryview(b"").cast("d")
+                else:
+                    values = memoryview(mmap.mmap(block_file.fileno(), 0, access=mmap.ACCESS_READ)).cast("d")
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return values
+
+    def store(self, key: str, values: Sequence[float]) -> None:
+        path = self.get_path(key)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as block_file:
+            array("d", values).tofile(block_file)
+        os.replace(temporary_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        # Other processes sharing the directory may remove blocks concurrently.
+        blocks = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(BLOCK_SUFFIX):
+                    with contextlib.suppress(FileNotFoundError):
+                        status = entry.stat()
+                        blocks.append((status.st_mtime, status.st_size, entry.path))
+
+        total_bytes = sum(size for _, size, _ in blocks)
+        for _, size, path in sorted(blocks):
+            if total_bytes <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total_bytes -= size
+
+    def get_or_compute(
+        self,
+        model: str,
+        version: str,
+        parameters,
+        compute: Callable[[], Sequence[float]],
+    ) -> Sequence[float]:
+        key = self.make_key(model, version, parameters)
+        values = self.load(key)
+        if values is None:
+            values = compute()
+            self.store(key, values)
+        return values
@@ -1,11 +1,216 @@
+import argparse
+import itertools
+import mmap
+import operator
+import os
+import sys
+import time
+from array import array
+from multiprocessing import Pool
+from typing import BinaryIO
+
 VOWELS = 'aeiou'
+DEFAULT_CHUNK_SIZE = 1 << 24
+INDEX_SUFFIX = ".vowels.idx"
+INDEX_HEADER_LENGTH = 2
+
+
+def count_vowels_in_bytes(data: bytes) -> dict[str, int]:
+    return {vowel: data.count(vowel.encode()) for vowel in VOWELS}
+
+
+def add_counts(total: dict[str, int], counts: dict[str, int]) -> None:
+    for vowel, count in counts.items():
+        total[vowel] += count
+
+
+def count_vowels_in_stream(
+    stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> tuple[dict[str, int], int]:
+    # Also returns the number of bytes read, as a stream has no size to ask for.
+    counts = dict.fromkeys(VOWELS, 0)
+    number_of_bytes = 0
+    while chunk := stream.read(chunk_size):
+        add_counts(counts, count_vowels_in_bytes(chunk))
+        number_of_bytes += len(chunk)
+    return counts, number_of_bytes
+
+
+def count_vowels_in_range(
+    path: str, start: int, end: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> dict[str, int]:
+    counts = dict.fromkeys(VOWELS, 0)
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for chunk_start in range(start, end, chunk_size):
+            add_counts(counts, count_vowels_in_bytes(data[chunk_start : min(chunk_start + chunk_size, end)]))
+    return counts
+
+
+def count_vowels_in_file(path: str, processes: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict[str, int]:
+    file_size = os.path.getsize(path)
+    if file_size == 0:
+        return dict.fromkeys(VOWELS, 0)
+    if processes == 1:
+        return count_vowels_in_range(path, 0, file_size, chunk_size)
+
+    # Vowels are single bytes, so the file can be split at any offset.
+    range_size = -(-file_size // processes)
+    ranges = [
+        (path, start, min(start + range_size, file_size), chunk_size)
+        for start in range(0, file_size, range_size)
+    ]
+
+    counts = dict.fromkeys(VOWELS, 0)
+    with Pool(processes) as pool:
+        for range_counts in pool.starmap(count_vowels_in_range, ranges):
+            add_counts(counts, range_counts)
+    return counts
+
+
+def build_vowel_index(
+    corpus_path: str,
+    checkpoint_interval: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> str:
+    # The index holds, for each vowel, the number of times it occurs in
+    # corpus[:c * checkpoint_interval] for every checkpoint c, as int64
+    # columns after a (checkpoint_interval, corpus_size) header.
+    corpus_size = os.path.getsize(corpus_path)
+    number_of_checkpoints = corpus_size // checkpoint_interval + 1
+    chunk_size = max(chunk_size // checkpoint_interval, 1) * checkpoint_interval
+    index_path = corpus_path + INDEX_SUFFIX
+
+    with open(corpus_path, "rb") as corpus_file, open(index_path, "wb+") as index_file:
+        index_file.truncate(8 * (INDEX_HEADER_LENGTH + len(VOWELS) * number_of_checkpoints))
+
+        with mmap.mmap(index_file.fileno(), 0) as buffer:
+            table = memoryview(buffer).cast("q")
+            columns = []
+            # Released even on error, as the mmap cannot close while exported.
+            try:
+                table[:INDEX_HEADER_LENGTH] = array("q", (checkpoint_interval, corpus_size))
+                columns = [
+                    table[start : start + number_of_checkpoints]
+                    for start in range(INDEX_HEADER_LENGTH, len(table), number_of_checkpoints)
+                ]
+
+                totals = [0] * len(VOWELS)
+                checkpoint = 1
+
+                # Chunks are whole multiples of the interval, so only the final
+                # partial block of the corpus falls between checkpoints.
+                while chunk := corpus_file.read(chunk_size):
+                    number_of_blocks = len(chunk) // checkpoint_interval
+
+                    for column, vowel_index, vowel in zip(columns, range(len(VOWELS)), VOWELS.encode()):
+                        if checkpoint_interval == 1:
+                            block_counts = map(operator.eq, chunk, itertools.repeat(vowel))
+                        else:
+                            block_counts = (
+                                chunk.count(vowel, start, start + checkpoint_interval)
+                                for start in range(0, number_of_blocks * checkpoint_interval, checkpoint_interval)
+                            )
+                        cumulative_counts = itertools.accumulate(block_counts, initial=totals[vowel_index])
+                        column[checkpoint : checkpoint + number_of_blocks] = array(
+                            "q", itertools.islice(cumulative_counts, 1, number_of_blocks + 1)
+                        )
+                        totals[vowel_index] += chunk.count(vowel)
+
+                    checkpoint += number_of_blocks
+            finally:
+                for column in columns:
+                    column.release()
+                table.release()
+
+    return index_path
+
+
+class VowelIndex:
+    def __init__(self, corpus_path: str):
+        # An empty corpus cannot be memory-mapped; its index still holds a
+        # header and one checkpoint.
+        with open(corpus_path, "rb") as corpus_file:
+            if os.fstat(corpus_file.fileno()).st_size == 0:
+                self.corpus = b""
+            else:
+                self.corpus = mmap.mmap(corpus_file.fileno(), 0, access=mmap.ACCESS_READ)
+        with open(corpus_path + INDEX_SUFFIX, "rb") as index_file:
+            self.buffer = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.table = memoryview(self.buffer).cast("q")
+        self.checkpoint_interval, self.corpus_size = self.table[:INDEX_HEADER_LENGTH]
+        # A corpus edited since the index was built would give wrong counts.
+        corpus_size = len(self.corpus)
+        if self.corpus_size != corpus_size:
+            self.columns = []
+            self.close()
+            raise ValueError(
+                f"The index was built for {self.corpus_size} bytes but the corpus has {corpus_size}; rebuild it."
+            )
+        number_of_checkpoints = self.corpus_size // self.checkpoint_interval + 1
+        self.columns = [
+            self.table[start : start + number_of_checkpoints]
+            for start in range(INDEX_HEADER_LENGTH, len(self.table), number_of_checkpoints)
+        ]
+
+    def count_before(self, position: int) -> list[int]:
+        # Nearest checkpoint plus at most checkpoint_interval - 1 scanned bytes.
+        checkpoint, remainder = divmod(position, self.checkpoint_interval)
+        counts = [column[checkpoint] for column in self.columns]
+        if remainder:
+            tail = self.corpus[position - remainder : position]
+            counts = [count + tail.count(vowel) for count, vowel in zip(counts, VOWELS.encode())]
+        return counts
+
+    def count_vowels_in_range(self, start: int, end: int) -> dict[str, int]:
+        start = max(0, min(start, self.corpus_size))
+        end = max(start, min(end, self.corpus_size))
+        return {
+            vowel: end_count - start_count
+            for vowel, start_count, end_count in zip(VOWELS, self.count_before(start), self.count_before(end))
+        }
+
+    def close(self) -> None:
+        for column in self.columns:
+            column.release()
+        self.table.release()
+        self.buffer.close()
+        if isinstance(self.corpus, mmap.mmap):
+            self.corpus.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count the vowels in a string, a file or stdin.")
+    parser.add_argument("path", nargs="?", help="file to count, or - for stdin; prompts for a string if omitted")
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    arguments = parser.parse_args()
+    if arguments.processes < 1:
+        parser.error("--processes must be at least 1")
+    if arguments.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    if arguments.path is None:
+        string = input("Enter a string of lower case characters: ")
 
-string = input("Enter a string of lower case characters: ")
+        num_of_vowels = 0
 
-num_of_vowels = 0
+        for character in string:
+            if character in VOWELS:
+                num_of_vowels += 1
 
-for character in string:
-    if character in VOWELS:
-        num_of_vowels += 1
+        print("Number of vowels:", num_of_vowels)
+    else:
+        started = time.perf_counter()
+        if arguments.path == "-":
+            counts, number_of_bytes = count_vowels_in_stream(sys.stdin.buffer, arguments.chunk_size)
+        else:
+            counts = count_vowels_in_file(arguments.path, arguments.processes, arguments.chunk_size)
+            number_of_bytes = os.path.getsize(arguments.path)
+        elapsed = time.perf_counter() - started
 
-print("Number of vowels:", num_of_vowels)
\ No newline at end of file
+        print("Number of vowels:", sum(counts.values()))
+        for vowel, count in counts.items():
+            print(f"  {vowel}: {count}")
+        if elapsed > 0:
+            print(f"Throughput: {number_of_bytes / elapsed / 1e6:.1f} MB/s")
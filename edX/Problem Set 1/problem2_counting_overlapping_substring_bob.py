@@ -1,11 +1,290 @@
-string = input("Enter a string of lower case characters: ")
+import argparse
+import bisect
+import itertools
+import mmap
+import os
+import sys
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from typing import BinaryIO
 
-count = start = 0
+DEFAULT_CHUNK_SIZE = 1 << 20
+SUFFIX_ARRAY_SUFFIX = ".sa"
+# Building the suffix array takes linear time and about 30 bytes of memory per
+# byte of text, i.e. about 15 GB at this default limit.
+MAX_INDEXED_TEXT_SIZE = 1 << 29
 
-while True:
-    start = string.find("bob", start) + 1
-    if start == 0:
-        break
-    count += 1
 
-print("Number of times bob occurs is:", count)
\ No newline at end of file
+def build_automaton(patterns: Sequence[bytes]) -> tuple[list[dict[int, int]], list[int], list[int], list[int]]:
+    # Aho-Corasick automaton: returns the trie transitions, failure links,
+    # states in breadth-first order and the final state of each pattern.
+    transitions = [{}]
+    pattern_states = []
+
+    for pattern in patterns:
+        if not pattern:
+            raise ValueError("Patterns must not be empty.")
+        state = 0
+        for byte in pattern:
+            if byte not in transitions[state]:
+                transitions.append({})
+                transitions[state][byte] = len(transitions) - 1
+            state = transitions[state][byte]
+        pattern_states.append(state)
+
+    failures = [0] * len(transitions)
+    order = []
+    queue = deque(transitions[0].values())
+
+    while queue:
+        state = queue.popleft()
+        order.append(state)
+        for byte, next_state in transitions[state].items():
+            failure = failures[state]
+            while failure and byte not in transitions[failure]:
+                failure = failures[failure]
+            failures[next_state] = transitions[failure].get(byte, 0)
+            queue.append(next_state)
+
+    return transitions, failures, order, pattern_states
+
+
+def count_patterns(
+    stream: BinaryIO,
+    patterns: Sequence[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[str, int]:
+    transitions, failures, order, pattern_states = build_automaton([pattern.encode() for pattern in patterns])
+    visits = [0] * len(transitions)
+    state = 0
+
+    # The automaton state carries over between chunks, so matches that cross
+    # a chunk boundary are still found.
+    while chunk := stream.read(chunk_size):
+        for byte in chunk:
+            while state and byte not in transitions[state]:
+                state = failures[state]
+            state = transitions[state].get(byte, 0)
+            visits[state] += 1
+
+    # Every visit to a state is also a match of each pattern ending at one of
+    # its failure-link ancestors, so push counts up the failure tree.
+    for state in reversed(order):
+        visits[failures[state]] += visits[state]
+
+    return {pattern: visits[state] for pattern, state in zip(patterns, pattern_states)}
+
+
+def _sort_suffixes(values: Sequence[int], upper: int) -> array:
+    # SA-IS: sort the LMS suffixes (an S-type suffix right after an L-type one)
+    # by induction, recurse on their names if any LMS substrings tie, then
+    # induce the order of every other suffix from them. Linear time.
+    length = len(values)
+    if length < 2:
+        return array("q", range(length))
+
+    # Suffix i is S-type if it is smaller than suffix i + 1. The last suffix
+    # is L-type, being larger than the empty one.
+    is_s_type = bytearray(length)
+    for i in range(length - 2, -1, -1):
+        is_s_type[i] = is_s_type[i + 1] if values[i] == values[i + 1] else values[i] < values[i + 1]
+
+    bucket_sizes = array("q", bytes(8 * (upper + 1)))
+    for value in values:
+        bucket_sizes[value] += 1
+    bucket_ends = array("q", itertools.accumulate(bucket_sizes))
+    bucket_starts = array("q", map(int.__sub__, bucket_ends, bucket_sizes))
+    del bucket_sizes
+
+    suffix_array = array("q", bytes(8 * length))
+
+    def induce_sort(lms_positions: Sequence[int]) -> None:
+        # LMS suffixes go to the ends of their buckets, in the given order;
+        # L-type suffixes then fill buckets from the front in a forward scan,
+        # and S-type suffixes from the back in a backward scan.
+        suffix_array[:] = array("q", itertools.repeat(-1, length))
+        slots = bucket_ends[:]
+        for position in reversed(lms_positions):
+            value = values[position]
+            slots[value] -= 1
+            suffix_array[slots[value]] = position
+
+        slots = bucket_starts[:]
+        value = values[length - 1]
+        suffix_array[slots[value]] = length - 1
+        slots[value] += 1
+        for index in range(length):
+            position = suffix_array[index] - 1
+            if position >= 0 and not is_s_type[position]:
+                value = values[position]
+                suffix_array[slots[value]] = position
+                slots[value] += 1
+
+        slots = bucket_ends[:]
+        for index in range(length - 1, -1, -1):
+            position = suffix_array[index] - 1
+            if position >= 0 and is_s_type[position]:
+                value = values[position]
+                slots[value] -= 1
+                suffix_array[slots[value]] = position
+
+    lms_positions = array("q", (i for i in range(1, length) if is_s_type[i] and not is_s_type[i - 1]))
+    number_of_lms = len(lms_positions)
+    induce_sort(lms_positions)
+    if not number_of_lms:
+        return suffix_array
+
+    # Induction from LMS suffixes in text order already sorts the LMS
+    # substrings, so equal neighbours get equal names.
+    lms_indices = array("q", itertools.repeat(-1, length))
+    for index, position in enumerate(lms_positions):
+        lms_indices[position] = index
+    sorted_lms = array("q", (position for position in suffix_array if lms_indices[position] != -1))
+
+    def get_lms_end(position: int) -> int:
+        index = lms_indices[position] + 1
+        return lms_positions[index] if index < number_of_lms else length
+
+    names = array("q", bytes(8 * number_of_lms))
+    name = 0
+    for previous, current in zip(sorted_lms, sorted_lms[1:]):
+        previous_end = get_lms_end(previous)
+        current_end = get_lms_end(current)
+        # The substring running to the end of the text is unique.
+        if (
+            previous_end == length
+            or current_end == length
+            or values[previous : previous_end + 1] != values[current : current_end + 1]
+        ):
+            name += 1
+        names[lms_indices[current]] = name
+    del lms_indices
+
+    # With all names distinct the LMS suffixes are already in order.
+    if name < number_of_lms - 1:
+        sorted_lms = array("q", map(lms_positions.__getitem__, _sort_suffixes(names, name)))
+    induce_sort(sorted_lms)
+    return suffix_array
+
+
+def _check_text_size(text_size: int, max_text_size: int) -> None:
+    if text_size > max_text_size:
+        raise ValueError(f"Texts over {max_text_size} bytes are too large to index.")
+
+
+def build_suffix_array(text: bytes, max_text_size: int = MAX_INDEXED_TEXT_SIZE) -> array:
+    _check_text_size(len(text), max_text_size)
+    return _sort_suffixes(text, 255)
+
+
+def build_substring_index(text_path: str, max_text_size: int = MAX_INDEXED_TEXT_SIZE) -> None:
+    _check_text_size(os.path.getsize(text_path), max_text_size)
+    with open(text_path, "rb") as text_file:
+        text = text_file.read()
+
+    with open(text_path + SUFFIX_ARRAY_SUFFIX, "wb") as index_file:
+        build_suffix_array(text, max_text_size).tofile(index_file)
+
+
+class SubstringIndex:
+    def __init__(self, text_path: str):
+        self.buffers = []
+        for path in (text_path, text_path + SUFFIX_ARRAY_SUFFIX):
+            with open(path, "rb") as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    self.buffers.append(b"")
+                else:
+                    self.buffers.append(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+        self.text = self.buffers[0]
+        self.suffix_array = memoryview(self.buffers[1]).cast("q")
+
+        # A text edited since the index was built would give wrong counts.
+        number_of_suffixes, text_size = len(self.suffix_array), len(self.text)
+        if number_of_suffixes != text_size:
+            self.close()
+            raise ValueError(
+                f"The suffix array has {number_of_suffixes} entries but the text has {text_size} bytes; rebuild it."
+            )
+
+    def count_occurrences(self, pattern: str) -> int:
+        # Suffixes starting with the pattern are contiguous in the suffix
+        # array, one per (possibly overlapping) occurrence.
+        pattern = pattern.encode()
+        if not pattern:
+            raise ValueError("Patterns must not be empty.")
+
+        def get_prefix(start: int) -> bytes:
+            return self.text[start : start + len(pattern)]
+
+        first = bisect.bisect_left(self.suffix_array, pattern, key=get_prefix)
+        last = bisect.bisect_right(self.suffix_array, pattern, lo=first, key=get_prefix)
+        return last - first
+
+    def close(self) -> None:
+        self.suffix_array.release()
+        for buffer in self.buffers:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count overlapping occurrences of substrings.")
+    parser.add_argument("path", nargs="?", help="file to search, or - for stdin; prompts for a string if omitted")
+    parser.add_argument("--pattern", action="append", help="pattern to count; may be repeated")
+    parser.add_argument("--patterns-file", help="file with one pattern per line")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--use-index", action="store_true", help="answer from a suffix array, building it if missing or stale"
+    )
+    parser.add_argument("--max-index-size", type=int, default=MAX_INDEXED_TEXT_SIZE, help="largest text to index")
+    arguments = parser.parse_args()
+    # The index is memory-mapped next to the text, so it needs a real file.
+    if arguments.use_index and arguments.path in (None, "-"):
+        parser.error("--use-index requires a file path")
+
+    if arguments.path is None:
+        string = input("Enter a string of lower case characters: ")
+
+        count = start = 0
+
+        while True:
+            start = string.find("bob", start) + 1
+            if start == 0:
+                break
+            count += 1
+
+        print("Number of times bob occurs is:", count)
+    else:
+        patterns = list(arguments.pattern or [])
+        if arguments.patterns_file:
+            with open(arguments.patterns_file) as patterns_file:
+                patterns.extend(line.rstrip("\n") for line in patterns_file if line.rstrip("\n"))
+        patterns = list(dict.fromkeys(patterns or ["bob"]))
+
+        if arguments.use_index:
+            index_path = arguments.path + SUFFIX_ARRAY_SUFFIX
+            # Rebuild an index older than the text; SubstringIndex also checks
+            # that their sizes agree.
+            is_stale = (
+                not os.path.exists(index_path)
+                or os.path.getmtime(index_path) < os.path.getmtime(arguments.path)
+                or os.path.getsize(index_path) != 8 * os.path.getsize(arguments.path)
+            )
+            if is_stale:
+                try:
+                    build_substring_index(arguments.path, arguments.max_index_size)
+                except ValueError as error:
+                    parser.error(str(error))
+            index = SubstringIndex(arguments.path)
+            counts = {pattern: index.count_occurrences(pattern) for pattern in patterns}
+            index.close()
+        elif arguments.path == "-":
+            counts = count_patterns(sys.stdin.buffer, patterns, arguments.chunk_size)
+        else:
+            with open(arguments.path, "rb") as file:
+                counts = count_patterns(file, patterns, arguments.chunk_size)
+
+        for pattern, count in counts.items():
+            print(f"{pattern}: {count}")
@@ -1,17 +1,196 @@
-string = input("Enter a string of lower case characters: ")
+import argparse
+import bisect
+import functools
+import itertools
+import mmap
+import operator
+import os
+from collections.abc import Sequence
+from multiprocessing import Pool
+from typing import NamedTuple
 
-start = longest_start = max_length = 0
+DEFAULT_CHUNK_SIZE = 1 << 20
 
-for i in range(1, len(string) + 1):
-    if i < len(string) and string[i] >= string[i - 1]:
-        continue
+
+class RunSummary(NamedTuple):
+    start: int
+    length: int
+    first_byte: int
+    last_byte: int
+    prefix_length: int
+    suffix_length: int
+    best_start: int
+    best_length: int
+
+
+def summarize_runs(data: bytes, offset: int = 0) -> RunSummary:
+    # Same scan as the interactive mode, additionally remembering the run the
+    # chunk starts with and the run it ends with. data must not be empty.
+    start = longest_start = max_length = prefix_length = 0
+
+    for i in range(1, len(data) + 1):
+        if i < len(data) and data[i] >= data[i - 1]:
+            continue
+        else:
+            if prefix_length == 0:
+                prefix_length = i
+            if i - start > max_length:
+                max_length = i - start
+                longest_start = start
+            if i < len(data):
+                start = i
+
+    return RunSummary(
+        offset,
+        len(data),
+        data[0],
+        data[-1],
+        prefix_length,
+        len(data) - start,
+        offset + longest_start,
+        max_length,
+    )
+
+
+def combine_runs(left: RunSummary, right: RunSummary) -> RunSummary:
+    is_joined = left.last_byte <= right.first_byte
+    candidates = [(left.best_length, -left.best_start), (right.best_length, -right.best_start)]
+
+    if is_joined:
+        crossing_start = left.start + left.length - left.suffix_length
+        candidates.append((left.suffix_length + right.prefix_length, -crossing_start))
+
+    # Longest run wins; among equals, the earliest start, as in the sequential scan.
+    best_length, best_start = max(candidates)
+
+    prefix_length = left.prefix_length
+    if is_joined and left.prefix_length == left.length:
+        prefix_length += right.prefix_length
+
+    suffix_length = right.suffix_length
+    if is_joined and right.suffix_length == right.length:
+        suffix_length += left.suffix_length
+
+    return RunSummary(
+        left.start,
+        left.length + right.length,
+        left.first_byte,
+        right.last_byte,
+        prefix_length,
+        suffix_length,
+        -best_start,
+        best_length,
+    )
+
+
+def summarize_file_range(path: str, start: int, end: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> RunSummary:
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return functools.reduce(
+            combine_runs,
+            (
+                summarize_runs(data[chunk_start : min(chunk_start + chunk_size, end)], chunk_start)
+                for chunk_start in range(start, end, chunk_size)
+            ),
+        )
+
+
+def find_longest_run_in_file(
+    path: str, processes: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> tuple[int, int]:
+
+    file_size = os.path.getsize(path)
+    if file_size == 0:
+        return 0, 0
+
+    processes = processes or os.cpu_count()
+    range_size = -(-file_size // processes)
+    ranges = [
+        (path, start, min(start + range_size, file_size), chunk_size) for start in range(0, file_size, range_size)
+    ]
+
+    with Pool(processes) as pool:
+        summaries = pool.starmap(summarize_file_range, ranges)
+
+    summary = functools.reduce(combine_runs, summaries)
+    return summary.best_start, summary.best_length
+
+
+def find_longest_runs_packed(
+    buffer: bytes | mmap.mmap, offsets: Sequence[int], slice_size: int = DEFAULT_CHUNK_SIZE
+) -> list[tuple[int, int]]:
+    # buffer holds many strings back to back; string k spans
+    # offsets[k]:offsets[k + 1]. Returns (start within the string, length) of
+    # each string's longest run.
+    data = memoryview(buffer)
+    runs = []
+
+    # Strings are taken in slices of whole strings of at most slice_size bytes
+    # (or a single longer string), so the list of breaks stays bounded.
+    first = 0
+    while first < len(offsets) - 1:
+        last = max(bisect.bisect_right(offsets, offsets[first] + slice_size, first + 1) - 1, first + 1)
+        slice_start, slice_end = offsets[first], offsets[last]
+
+        # Positions where the order breaks, found for the whole slice with
+        # C-level iterators instead of a per-character Python loop.
+        breaks = list(
+            itertools.compress(
+                itertools.count(slice_start + 1),
+                map(operator.lt, data[slice_start + 1 : slice_end], data[slice_start:slice_end]),
+            )
+        )
+
+        for string_start, string_end in zip(offsets[first:last], offsets[first + 1 : last + 1]):
+            if string_start == string_end:
+                runs.append((0, 0))
+                continue
+
+            boundaries = [
+                string_start,
+                *breaks[bisect.bisect_right(breaks, string_start) : bisect.bisect_left(breaks, string_end)],
+                string_end,
+            ]
+            lengths = list(map(operator.sub, boundaries[1:], boundaries))
+            max_length = max(lengths)
+            # index() returns the first maximum, i.e. the earliest run.
+            runs.append((boundaries[lengths.index(max_length)] - string_start, max_length))
+
+        first = last
+
+    data.release()
+    return runs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find the longest substring in alphabetical order.")
+    parser.add_argument("path", nargs="?", help="file to scan in parallel; prompts for a string if omitted")
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    arguments = parser.parse_args()
+
+    if arguments.path is None:
+        string = input("Enter a string of lower case characters: ")
+
+        start = longest_start = max_length = 0
+
+        for i in range(1, len(string) + 1):
+            if i < len(string) and string[i] >= string[i - 1]:
+                continue
+            else:
+                if i - start > max_length:
+                    max_length = i - start
+                    longest_start = start
+                start = i
+
+        print(
+            "Longest substring in alphabetical order is:",
+            string[longest_start : longest_start + max_length],
+        )
     else:
-        if i - start > max_length:
-            max_length = i - start
-            longest_start = start
-        start = i
-
-print(
-    "Longest substring in alphabetical order is:",
-    string[longest_start : longest_start + max_length],
-)
+        longest_start, max_length = find_longest_run_in_file(
+            arguments.path, arguments.processes, arguments.chunk_size
+        )
+
+        with open(arguments.path, "rb") as file:
+            file.seek(longest_start)
+            print("Longest substring in alphabetical order is:", file.read(max_length).decode())
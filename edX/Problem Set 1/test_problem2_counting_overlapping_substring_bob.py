@@ -0,0 +1,77 @@
+import os
+import random
+import tempfile
+import unittest
+
+from problem2_counting_overlapping_substring_bob import (
+    SubstringIndex,
+    build_substring_index,
+    build_suffix_array,
+)
+
+
+def count_overlapping(text: str, pattern: str) -> int:
+    count = start = 0
+    while (start := text.find(pattern, start) + 1) != 0:
+        count += 1
+    return count
+
+
+class SuffixArrayTest(unittest.TestCase):
+    def setUp(self):
+        self.random = random.Random(6001)
+
+    def assertSorted(self, text: bytes):
+        expected = sorted(range(len(text)), key=lambda i: text[i:])
+        self.assertEqual(list(build_suffix_array(text)), expected, text)
+
+    def testEdgeCases(self):
+        for text in (b"", b"a", b"ab", b"ba", b"aab", b"a" * 50, b"ab" * 25, b"mmiissiissiippii", bytes(range(256))):
+            self.assertSorted(text)
+
+    def testRandomTexts(self):
+        for alphabet in (b"ab", b"abc", b"bo", b"\x00az\xff"):
+            for _ in range(300):
+                length = self.random.randint(0, 60)
+                self.assertSorted(bytes(self.random.choice(alphabet) for _ in range(length)))
+
+    def testTextTooLarge(self):
+        with self.assertRaises(ValueError):
+            build_suffix_array(b"abcd", max_text_size=3)
+
+
+class SubstringIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.random = random.Random(6002)
+        self.directory = tempfile.TemporaryDirectory()
+        self.text_path = os.path.join(self.directory.name, "text.txt")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_text(self, text: str):
+        with open(self.text_path, "w") as text_file:
+            text_file.write(text)
+
+    def testCountsMatchFind(self):
+        for _ in range(50):
+            text = "".join(self.random.choice("bo") for _ in range(self.random.randint(0, 200)))
+            self.write_text(text)
+            build_substring_index(self.text_path)
+
+            index = SubstringIndex(self.text_path)
+            for pattern in ("b", "o", "bob", "obo", "bobob", "bb", "x"):
+                self.assertEqual(index.count_occurrences(pattern), count_overlapping(text, pattern), (text, pattern))
+            index.close()
+
+    def testStaleIndexIsRejected(self):
+        self.write_text("azcbobobegghakl")
+        build_substring_index(self.text_path)
+        self.write_text("azcbobobegghaklbob")
+
+        with self.assertRaises(ValueError):
+            SubstringIndex(self.text_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import heapq
+import math
+from collections.abc import Sequence
+
+from problem2_paying_debt_off_in_a_year import calculate_balance_after_payment
+
+DEFAULT_HORIZON_MONTHS = 360
+
+
+def count_months_until_coverable(balance: float, monthly_interest_rate: float, budget: float) -> int | None:
+    # Smallest k such that k full-budget months leave at most one budget owed,
+    # or None when the budget never outpaces the interest.
+    if balance <= budget:
+        return 0
+    if budget <= 0:
+        return None
+    if monthly_interest_rate == 0:
+        return math.ceil((balance - budget) / budget)
+
+    growth = 1 + monthly_interest_rate
+    steady_balance = budget * growth / monthly_interest_rate
+    if steady_balance <= balance:
+        return None
+
+    number_of_months = max(
+        math.ceil(math.log((steady_balance - budget) / (steady_balance - balance)) / math.log(growth)), 0
+    )
+
+    # Guard against rounding in the logarithm.
+    while (
+        number_of_months > 0
+        and calculate_balance_after_payment(balance, monthly_interest_rate, budget, number_of_months - 1) <= budget
+    ):
+        number_of_months -= 1
+    while calculate_balance_after_payment(balance, monthly_interest_rate, budget, number_of_months) > budget:
+        number_of_months += 1
+
+    return number_of_months
+
+
+def allocate_budget(
+    balances: Sequence[float],
+    annual_interest_rates: Sequence[float],
+    monthly_budget: float,
+    strategy: str = "avalanche",
+    horizon_months: int = DEFAULT_HORIZON_MONTHS,
+) -> tuple[list[int | None], float]:
+    # Each month the whole budget goes to the open card with the highest
+    # priority and any leftover rolls to the next one. Avalanche prioritises
+    # the highest rate, snowball the smallest starting balance.
+    #
+    # Returns the month each card is paid off (None if still open at the
+    # horizon) and the total interest charged over the horizon.
+    if strategy == "avalanche":
+        priorities = [-rate for rate in annual_interest_rates]
+    elif strategy == "snowball":
+        priorities = list(balances)
+    else:
+        raise ValueError(f"Unknown strategy: {strategy}")
+
+    monthly_interest_rates = [rate / 12.0 for rate in annual_interest_rates]
+    # Cards nobody is paying only grow, so balances are stored with the month
+    # they were last updated and brought forward on demand.
+    stored_balances = list(balances)
+    stored_months = [0] * len(balances)
+    payoff_months: list[int | None] = [None] * len(balances)
+
+    def balance_at(card: int, month: int) -> float:
+        growth = (1 + monthly_interest_rates[card]) ** (month - stored_months[card])
+        return stored_balances[card] * growth
+
+    open_cards = [(priority, card) for card, priority in enumerate(priorities) if balances[card] > 0]
+    heapq.heapify(open_cards)
+    for card, balance in enumerate(balances):
+        if balance <= 0:
+            payoff_months[card] = 0
+
+    month = 0
+    total_paid = 0
+
+    while open_cards and month < horizon_months:
+        card = open_cards[0][1]
+        balance = balance_at(card, month)
+
+        # Jump straight to the month in which the target card can be cleared.
+        number_of_months = count_months_until_coverable(balance, monthly_interest_rates[card], monthly_budget)
+        if number_of_months is None or month + number_of_months >= horizon_months:
+            number_of_months = horizon_months - month
+
+        stored_balances[card] = calculate_balance_after_payment(
+            balance, monthly_interest_rates[card], monthly_budget, number_of_months
+        )
+        stored_months[card] = month = month + number_of_months
+        total_paid += monthly_budget * number_of_months
+
+        if month == horizon_months:
+            break
+
+        remaining_budget = monthly_budget
+        while open_cards and remaining_budget > 0:
+            card = open_cards[0][1]
+            balance = balance_at(card, month)
+            payment = min(remaining_budget, balance)
+            remaining_budget -= payment
+            total_paid += payment
+
+            if payment == balance:
+                heapq.heappop(open_cards)
+                payoff_months[card] = month + 1
+            else:
+                stored_balances[card] = (balance - payment) * (1 + monthly_interest_rates[card])
+                stored_months[card] = month + 1
+
+        month += 1
+
+    remaining_balance = sum(balance_at(card, horizon_months) for _, card in open_cards)
+    total_interest = total_paid + remaining_balance - sum(max(balance, 0) for balance in balances)
+
+    return payoff_months, total_interest
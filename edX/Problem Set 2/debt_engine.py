@@ -0,0 +1,97 @@
+from array import array
+from collections.abc import Iterable
+
+from problem2_paying_debt_off_in_a_year import calculate_exact_payment
+
+
+class DebtEngine:
+    # Per-account state lives in flat arrays. The cached lowest payment to
+    # clear each account in its remaining months is only recomputed for
+    # accounts whose inputs changed; paying exactly the cached payment leaves
+    # it unchanged for the following month.
+
+    def __init__(self):
+        self.balances = array("d")
+        self.monthly_interest_rates = array("d")
+        self.monthly_payments = array("d")
+        self.remaining_months = array("q")
+        self.lowest_payments = array("d")
+        self.is_stale = bytearray()
+
+    def add_account(
+        self,
+        balance: float,
+        annual_interest_rate: float,
+        monthly_payment: float,
+        remaining_months: int,
+    ) -> int:
+        self.balances.append(balance)
+        self.monthly_interest_rates.append(annual_interest_rate / 12.0)
+        self.monthly_payments.append(monthly_payment)
+        self.remaining_months.append(remaining_months)
+        self.lowest_payments.append(0)
+        self.is_stale.append(True)
+        return len(self.balances) - 1
+
+    def apply_event(self, account: int, kind: str, value: float) -> None:
+        if kind == "rate":
+            self.monthly_interest_rates[account] = value / 12.0
+        elif kind == "payment":
+            self.monthly_payments[account] = value
+        elif kind == "charge":
+            self.balances[account] += value
+        else:
+            raise ValueError(f"Unknown event kind: {kind}")
+
+        if kind != "payment":
+            self.is_stale[account] = True
+
+    def apply_events(self, events: Iterable[tuple[int, str, float]]) -> None:
+        for account, kind, value in events:
+            self.apply_event(account, kind, value)
+
+    def advance_month(self) -> None:
+        for account in range(len(self.balances)):
+            if self.remaining_months[account] == 0:
+                continue
+
+            monthly_unpaid_balance = self.balances[account] - self.monthly_payments[account]
+            interest = self.monthly_interest_rates[account] * monthly_unpaid_balance
+            self.balances[account] = monthly_unpaid_balance + interest
+            self.remaining_months[account] -= 1
+
+            # The cached payment also stops applying once the account is due in
+            # full or paid off, even if it was paid exactly.
+            if (
+                self.monthly_payments[account] != self.lowest_payments[account]
+                or self.remaining_months[account] == 0
+                or self.balances[account] <= 0
+            ):
+                self.is_stale[account] = True
+
+    def refresh(self) -> int:
+        number_of_refreshed = 0
+
+        for account in range(len(self.balances)):
+            if not self.is_stale[account]:
+                continue
+
+            balance = self.balances[account]
+            if balance <= 0:
+                lowest_payment = 0
+            elif self.remaining_months[account] == 0:
+                lowest_payment = balance
+            else:
+                lowest_payment = calculate_exact_payment(
+                    balance, self.monthly_interest_rates[account], self.remaining_months[account]
+                )
+
+            self.lowest_payments[account] = lowest_payment
+            self.is_stale[account] = False
+            number_of_refreshed += 1
+
+        return number_of_refreshed
+
+    def get_lowest_payments(self) -> array:
+        self.refresh()
+        return self.lowest_payments
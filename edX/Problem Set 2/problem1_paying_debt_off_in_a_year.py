@@ -1,15 +1,86 @@
-balance = float(input("Enter the outstanding balance on the credit card: "))
-annual_interest_rate = float(input("Enter the annual interest rate as a decimal: "))
-monthly_payment_rate = float(input("Enter the minimum monthly payment rate as a decimal: "))
-monthly_interest_rate = annual_interest_rate / 12.0
+import contextlib
+import csv
+import itertools
+import os
+from array import array
 
-target_months = 12
+SCHEDULE_COLUMNS = ("minimum_monthly_payment", "monthly_unpaid_balance", "interest", "balance")
+DEFAULT_CHUNK_SIZE = 10_000
 
-while target_months:
-    minimum_monthly_payment = monthly_payment_rate * balance
-    monthly_unpaid_balance = balance - minimum_monthly_payment
-    interest = monthly_interest_rate * monthly_unpaid_balance
-    balance = monthly_unpaid_balance + interest
-    target_months -= 1
 
-print(f"Remaining balance: {balance:.2f}")
+def export_minimum_payment_schedule(
+    accounts_path: str,
+    output_directory: str,
+    target_months: int = 12,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    # Writes one raw file per column: "account" and "month" as int64, the
+    # SCHEDULE_COLUMNS as float64, one row per account and month.
+    os.makedirs(output_directory, exist_ok=True)
+    column_names = ("account", "month", *SCHEDULE_COLUMNS)
+    number_of_accounts = 0
+
+    with open(accounts_path, newline="") as accounts_file, contextlib.ExitStack() as stack:
+        column_files = {
+            name: stack.enter_context(open(os.path.join(output_directory, f"{name}.bin"), "wb"))
+            for name in column_names
+        }
+        accounts = csv.DictReader(accounts_file)
+
+        # A chunk is parsed in full before any of it is written, so a bad row
+        # leaves every column file with the same number of rows.
+        while chunk := list(itertools.islice(accounts, chunk_size)):
+            balances = [float(account["balance"]) for account in chunk]
+            monthly_payment_rates = [float(account["monthly_payment_rate"]) for account in chunk]
+            monthly_interest_rates = [float(account["annual_interest_rate"]) / 12.0 for account in chunk]
+
+            number_of_rows = len(chunk) * target_months
+            columns = {name: array("d", bytes(8 * number_of_rows)) for name in SCHEDULE_COLUMNS}
+            rows = range(number_of_rows)
+            columns["account"] = array("q", (number_of_accounts + row // target_months for row in rows))
+            columns["month"] = array("q", (row % target_months + 1 for row in rows))
+
+            # Step every account in the chunk through the same month together.
+            for month in range(target_months):
+                minimum_monthly_payments = [
+                    rate * balance for rate, balance in zip(monthly_payment_rates, balances)
+                ]
+                monthly_unpaid_balances = [
+                    balance - payment for balance, payment in zip(balances, minimum_monthly_payments)
+                ]
+                interests = [
+                    rate * unpaid for rate, unpaid in zip(monthly_interest_rates, monthly_unpaid_balances)
+                ]
+                balances = [unpaid + interest for unpaid, interest in zip(monthly_unpaid_balances, interests)]
+
+                rows = range(month, number_of_rows, target_months)
+                for name, values in zip(
+                    SCHEDULE_COLUMNS, (minimum_monthly_payments, monthly_unpaid_balances, interests, balances)
+                ):
+                    column = columns[name]
+                    for row, value in zip(rows, values):
+                        column[row] = value
+
+            for name in column_names:
+                columns[name].tofile(column_files[name])
+            number_of_accounts += len(chunk)
+
+    return number_of_accounts
+
+
+if __name__ == "__main__":
+    balance = float(input("Enter the outstanding balance on the credit card: "))
+    annual_interest_rate = float(input("Enter the annual interest rate as a decimal: "))
+    monthly_payment_rate = float(input("Enter the minimum monthly payment rate as a decimal: "))
+    monthly_interest_rate = annual_interest_rate / 12.0
+
+    target_months = 12
+
+    while target_months:
+        minimum_monthly_payment = monthly_payment_rate * balance
+        monthly_unpaid_balance = balance - minimum_monthly_payment
+        interest = monthly_interest_rate * monthly_unpaid_balance
+        balance = monthly_unpaid_balance + interest
+        target_months -= 1
+
+    print(f"Remaining balance: {balance:.2f}")
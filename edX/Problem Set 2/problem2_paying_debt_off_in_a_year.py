@@ -1,9 +1,26 @@
+import math
+
+PAYMENT_INCREMENT = 10
+
+
 def calculate_balance_after_payment(
     balance: float,
     monthly_interest_rate: float,
     monthly_payment: float,
     target_months: int,
-):
+    month_by_month: bool = False,
+) -> float:
+    if not month_by_month:
+        # Each month is the affine map balance -> (balance - payment) * (1 + rate),
+        # so n months collapse into the annuity formula.
+        if monthly_interest_rate == 0:
+            return balance - monthly_payment * target_months
+        growth = (1 + monthly_interest_rate) ** target_months
+        return (
+            growth * balance
+            - monthly_payment * (1 + monthly_interest_rate) * (growth - 1) / monthly_interest_rate
+        )
+
     while target_months:
         monthly_unpaid_balance = balance - monthly_payment
         interest = monthly_interest_rate * monthly_unpaid_balance
@@ -13,20 +30,38 @@ def calculate_balance_after_payment(
     return balance
 
 
-balance = float(input("Enter the outstanding balance on the credit card: "))
-annual_interest_rate = float(input("Enter the annual interest rate as a decimal: "))
-monthly_interest_rate = annual_interest_rate / 12.0
+def calculate_exact_payment(balance: float, monthly_interest_rate: float, target_months: int) -> float:
+    # Payment that leaves exactly zero after target_months, from solving the
+    # annuity formula in calculate_balance_after_payment for monthly_payment.
+    if monthly_interest_rate == 0:
+        return balance / target_months
+    growth = (1 + monthly_interest_rate) ** target_months
+    return balance * monthly_interest_rate * growth / ((1 + monthly_interest_rate) * (growth - 1))
+
+
+def find_lowest_payment(balance: float, monthly_interest_rate: float, target_months: int = 12) -> int:
+    if balance <= 0:
+        return 0
+
+    exact_payment = calculate_exact_payment(balance, monthly_interest_rate, target_months)
+    monthly_payment = max(PAYMENT_INCREMENT, math.ceil(exact_payment / PAYMENT_INCREMENT) * PAYMENT_INCREMENT)
+
+    # Rounding can put the exact payment on the wrong side of a multiple of 10.
+    while calculate_balance_after_payment(balance, monthly_interest_rate, monthly_payment, target_months) > 0:
+        monthly_payment += PAYMENT_INCREMENT
+    while monthly_payment > PAYMENT_INCREMENT and calculate_balance_after_payment(
+        balance, monthly_interest_rate, monthly_payment - PAYMENT_INCREMENT, target_months
+    ) <= 0:
+        monthly_payment -= PAYMENT_INCREMENT
 
+    return monthly_payment
 
-initial_balance = balance
-monthly_payment = 0
 
-while balance > 0:
-    balance = initial_balance
-    monthly_payment += 10
-    balance = calculate_balance_after_payment(
-        balance, monthly_interest_rate, monthly_payment, target_months=12
-    )
+if __name__ == "__main__":
+    balance = float(input("Enter the outstanding balance on the credit card: "))
+    annual_interest_rate = float(input("Enter the annual interest rate as a decimal: "))
+    monthly_interest_rate = annual_interest_rate / 12.0
 
+    monthly_payment = find_lowest_payment(balance, monthly_interest_rate, target_months=12)
 
-print(f"Lowest Payment: {monthly_payment}")
+    print(f"Lowest Payment: {monthly_payment}")
@@ -1,4 +1,12 @@
+import math
+from collections.abc import Sequence
+from multiprocessing import Pool
+
 EPSILON = 0.01
+CENTS_PER_DOLLAR = 100
+DEFAULT_CHUNK_SIZE = 10_000
+MODEL_NAME = "edx.problem3.lowest_payment"
+MODEL_VERSION = "1"
 
 
 def calculate_balance_after_payment(
@@ -6,7 +14,19 @@ def calculate_balance_after_payment(
     monthly_interest_rate: float,
     monthly_payment: float,
     target_months: int,
-):
+    month_by_month: bool = False,
+) -> float:
+    if not month_by_month:
+        # Each month is the affine map balance -> (balance - payment) * (1 + rate),
+        # so n months collapse into the annuity formula.
+        if monthly_interest_rate == 0:
+            return balance - monthly_payment * target_months
+        growth = (1 + monthly_interest_rate) ** target_months
+        return (
+            growth * balance
+            - monthly_payment * (1 + monthly_interest_rate) * (growth - 1) / monthly_interest_rate
+        )
+
     while target_months:
         monthly_unpaid_balance = balance - monthly_payment
         interest = monthly_interest_rate * monthly_unpaid_balance
@@ -16,24 +36,84 @@ def calculate_balance_after_payment(
     return balance
 
 
-balance = float(input("Enter the outstanding balance on the credit card: "))
-annual_interest_rate = float(input("Enter the annual interest rate as a decimal: "))
-monthly_interest_rate = annual_interest_rate / 12.0
+def find_lowest_payment_in_cents(balance: float, monthly_interest_rate: float, target_months: int = 12) -> int:
+    if balance <= 0:
+        return 0
+
+    lower_bound = math.floor(balance / target_months * CENTS_PER_DOLLAR)
+    upper_bound = math.ceil(
+        balance * (1 + monthly_interest_rate) ** target_months / target_months * CENTS_PER_DOLLAR
+    )
+
+    # Integer bisection over cents always terminates, in log2 of the bound gap.
+    while lower_bound < upper_bound:
+        monthly_payment = (lower_bound + upper_bound) // 2
+        remaining_balance = calculate_balance_after_payment(
+            balance, monthly_interest_rate, monthly_payment / CENTS_PER_DOLLAR, target_months
+        )
+        if remaining_balance > 0:
+            lower_bound = monthly_payment + 1
+        else:
+            upper_bound = monthly_payment
 
+    return lower_bound
 
-monthly_payment_lower_bound = balance / 12
-monthly_payment_upper_bound = (balance * (1 + monthly_interest_rate) ** 12) / 12.0
 
-initial_balance = balance
+def find_lowest_payments_chunk(accounts: list[tuple[float, float]]) -> list[float]:
+    return [
+        find_lowest_payment_in_cents(balance, annual_interest_rate / 12.0) / CENTS_PER_DOLLAR
+        for balance, annual_interest_rate in accounts
+    ]
 
-while abs(balance) > EPSILON:
-    balance = initial_balance
-    monthly_payment = (monthly_payment_lower_bound + monthly_payment_upper_bound) / 2
-    balance = calculate_balance_after_payment(balance, monthly_interest_rate, monthly_payment, target_months=12)
-    if balance > 0:
-        monthly_payment_lower_bound = monthly_payment + 0.01
+
+def find_lowest_payments(
+    balances: Sequence[float],
+    annual_interest_rates: Sequence[float],
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache=None,
+) -> list[float]:
+    # cache is an optional ResultCache (see OpenCourseWare/Problem Set 1/result_cache.py);
+    # only chunks it does not already hold are sent to the pool.
+    accounts = list(zip(balances, annual_interest_rates, strict=True))
+    chunks = [accounts[start : start + chunk_size] for start in range(0, len(accounts), chunk_size)]
+
+    if cache is None:
+        chunk_payments = [None] * len(chunks)
     else:
-        monthly_payment_upper_bound = monthly_payment - 0.01
+        keys = [cache.make_key(MODEL_NAME, MODEL_VERSION, chunk) for chunk in chunks]
+        chunk_payments = [cache.load(key) for key in keys]
+
+    missing_chunks = [index for index, payments in enumerate(chunk_payments) if payments is None]
+
+    with Pool(processes) as pool:
+        computed_payments = pool.map(find_lowest_payments_chunk, [chunks[index] for index in missing_chunks])
+
+    for index, payments in zip(missing_chunks, computed_payments):
+        chunk_payments[index] = payments
+        if cache is not None:
+            cache.store(keys[index], payments)
+
+    return [payment for payments in chunk_payments for payment in payments]
+
+
+if __name__ == "__main__":
+    balance = float(input("Enter the outstanding balance on the credit card: "))
+    annual_interest_rate = float(input("Enter the annual interest rate as a decimal: "))
+    monthly_interest_rate = annual_interest_rate / 12.0
+
+    monthly_payment_lower_bound = balance / 12
+    monthly_payment_upper_bound = (balance * (1 + monthly_interest_rate) ** 12) / 12.0
+
+    initial_balance = balance
 
+    while abs(balance) > EPSILON:
+        balance = initial_balance
+        monthly_payment = (monthly_payment_lower_bound + monthly_payment_upper_bound) / 2
+        balance = calculate_balance_after_payment(balance, monthly_interest_rate, monthly_payment, target_months=12)
+        if balance > 0:
+            monthly_payment_lower_bound = monthly_payment + 0.01
+        else:
+            monthly_payment_upper_bound = monthly_payment - 0.01
 
-print(f"Lowest Payment: {monthly_payment:.2f}")
+    print(f"Lowest Payment: {monthly_payment:.2f}")